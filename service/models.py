@@ -87,15 +87,22 @@ class Product(db.Model):
     def __repr__(self):
         return f"<Product {self.name} id=[{self.id}]>"
 
-    def create(self):
+    def create(self, commit: bool = True):
         """
         Creates a Product to the database
+
+        :param commit: False to only flush so the id is assigned without
+            ending the current transaction
+        :type commit: bool
         """
         logger.info("Creating %s", self.name)
         # id must be none to generate next primary key
         self.id = None  # pylint: disable=invalid-name
         db.session.add(self)
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
 
     def update(self):
         """
@@ -169,6 +176,27 @@ class Product(db.Model):
         app.app_context().push()
         db.create_all()  # make our sqlalchemy tables
 
+    @classmethod
+    def bulk_create(cls, products: list, commit: bool = True):
+        """Creates several Products in the database with a single commit
+
+        :param products: the Products to create
+        :type products: list
+        :param commit: False to only flush so the ids are assigned without
+            ending the current transaction
+        :type commit: bool
+
+        """
+        logger.info("Creating %d Products", len(products))
+        # id must be none to generate next primary key
+        for product in products:
+            product.id = None
+        db.session.add_all(products)
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
+
     @classmethod
     def all(cls) -> list:
         """Returns all of the Products in the database"""
@@ -208,7 +236,7 @@ class Product(db.Model):
         """Returns all Products with the given price
 
         :param price: the price to search for
-        :type name: float
+        :type price: Decimal
 
         :return: a collection of Products with that price
         :rtype: list
@@ -0,0 +1,103 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared pytest fixtures for the test suite
+"""
+import os
+import logging
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import scoped_session, sessionmaker
+from service.models import Product, db
+from service import app
+
+# The model tests use portable SQL so app_ctx defaults them to an in-memory
+# SQLite database; set DATABASE_URI to run them against PostgreSQL instead.
+# PostgreSQL must still be reachable unless DATABASE_URI is exported: the
+# service package creates its tables at import using its own default, and
+# the route tests keep that PostgreSQL default.
+DATABASE_URI = os.getenv("DATABASE_URI", "sqlite:///:memory:")
+
+
+def _use_worker_schema(worker: str):
+    """Points the app at a PostgreSQL schema private to a pytest-xdist worker"""
+    engine = create_engine(DATABASE_URI)
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {worker}"))
+    engine.dispose()
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        "connect_args": {"options": f"-csearch_path={worker}"}
+    }
+
+
+@contextmanager
+def _joined_session(connection):
+    """Binds db.session to a connection whose work is rolled back on exit"""
+    # Join the session into an external transaction that is never committed
+    app_session = db.session
+    transaction = connection.begin()
+    # SQLite only opens a transaction on the first SAVEPOINT, so hold one
+    # open to keep the session's own savepoints from committing on release
+    nested = connection.begin_nested()
+    db.session = scoped_session(
+        sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    )
+    try:
+        yield db.session
+    finally:
+        db.session.remove()
+        nested.rollback()
+        transaction.rollback()
+        db.session = app_session
+
+
+######################################################################
+#  F I X T U R E S
+######################################################################
+@pytest.fixture(scope="session")
+def app_ctx():
+    """Initializes the app and the database schema once per test session"""
+    app.config.update(TESTING=True, DEBUG=False, SQLALCHEMY_DATABASE_URI=DATABASE_URI)
+    app.logger.setLevel(logging.CRITICAL)
+    # give each pytest-xdist worker (gw0, gw1, ...) its own schema
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker and DATABASE_URI.startswith("postgresql"):
+        _use_worker_schema(worker)
+    Product.init_db(app)
+    yield app
+    db.session.close()
+
+
+@pytest.fixture
+def product_session(app_ctx):  # pylint: disable=redefined-outer-name, unused-argument
+    """Provides a session whose work is rolled back after each test"""
+    with db.engine.connect() as connection, _joined_session(connection) as session:
+        yield session
+
+
+@pytest.fixture(scope="module")
+def module_session(app_ctx):  # pylint: disable=redefined-outer-name, unused-argument
+    """Provides a session whose work is shared by a module and rolled back after it"""
+    # A private engine keeps the module's rows away from product_session:
+    # on PostgreSQL they stay uncommitted on their own connection, and an
+    # in-memory SQLite database belongs to the engine that opened it
+    engine = create_engine(DATABASE_URI, **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}))
+    with engine.connect() as connection:
+        db.metadata.create_all(connection)
+        connection.commit()
+        with _joined_session(connection) as session:
+            yield session
+    engine.dispose()
@@ -17,12 +17,12 @@
 Product API Service Test Suite
 
 Test cases can be run with the following:
-  nosetests -v --with-spec --spec-color
+  coverage run -m pytest
   coverage report -m
   codecov --token=$CODECOV_TOKEN
 
   While debugging just these tests it's convenient to use this:
-    nosetests --stop tests/test_service.py:TestProductService
+    pytest -x tests/test_routes.py
 """
 import os
 import logging